@@ -2,7 +2,26 @@
 Core functionality for the Whisper Audio Transcription application
 """
 
-from .system_checker import SystemChecker
-from .history_manager import HistoryManager
+import importlib
 
-__all__ = ['SystemChecker', 'HistoryManager']
+# Submodules are only imported when one of their names is first accessed
+_lazy_imports = {
+    'SystemChecker': '.system_checker',
+    'HistoryManager': '.history_manager',
+    'CachedSettings': '.settings',
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
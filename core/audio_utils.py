@@ -3,10 +3,123 @@ Audio utility functions for loading and converting audio files
 """
 
 import os
+import time
+import hashlib
+import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydub import AudioSegment
+
+# Whisper resamples everything to 16 kHz mono internally
+WHISPER_SAMPLE_RATE = 16000
+
+# Converted files are kept here and reused when the same file is loaded again
+AUDIO_CACHE_DIR = Path(tempfile.gettempdir()) / "see_my_speech_cache"
+
+# ffmpeg arguments shared by every conversion
+FFMPEG_BASE_ARGS = ["ffmpeg", "-nostdin", "-loglevel", "error", "-y"]
+FFMPEG_OUTPUT_ARGS = ["-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE), "-f", "wav"]
+
+
+def convert_to_wav(file_path: str, output_path: str) -> bool:
+    """
+    Convert an audio file to 16 kHz mono WAV using ffmpeg.
+    Returns True if the conversion succeeded.
+    """
+    command = [*FFMPEG_BASE_ARGS, "-i", file_path, *FFMPEG_OUTPUT_ARGS, output_path]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Error converting audio file: {result.stderr.strip()}")
+        return False
+    return True
+
+
+@lru_cache(maxsize=32)
+def _read_header(file_path: str, mtime_ns: int, size: int):
+    """Read the audio header, cached per file version (mtime and size)"""
+    # Imported here so the UI can use this module without loading libsndfile
+    import soundfile
+
+    try:
+        return soundfile.info(file_path)
+    except Exception:
+        return None
+
+
+def probe_audio(file_path: str):
+    """
+    Read sample rate, channels and subtype from the audio file header.
+    Returns a soundfile info object, or None if the format is not readable.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return _read_header(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def is_whisper_ready(file_path: str) -> bool:
+    """Check if the file is already 16-bit PCM mono at 16 kHz"""
+    header = probe_audio(file_path)
+    return (
+        header is not None
+        and header.samplerate == WHISPER_SAMPLE_RATE
+        and header.channels == 1
+        and header.subtype == 'PCM_16'
+    )
+
+
+def get_audio_duration(file_path: str) -> Optional[float]:
+    """
+    Get the duration of an audio file in seconds without decoding it.
+    Uses the file header via soundfile, falling back to ffprobe.
+    """
+    header = probe_audio(file_path)
+    if header is not None:
+        return header.duration
+
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "csv=p=0", file_path],
+            capture_output=True, text=True
+        )
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def get_cache_key(file_path: str) -> str:
+    """
+    Build a cache key from the first 64 KB of the file, its size and
+    modification time, so the whole file never has to be read.
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(f"{stat.st_size}:{stat.st_mtime_ns}:".encode())
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(1 << 16))
+    return digest.hexdigest()[:16]
+
+
+def cleanup_audio_cache(max_age_days: int = 7):
+    """
+    Remove converted files that have not been used for max_age_days, and
+    leftover partial conversions older than a day.
+    """
+    if not AUDIO_CACHE_DIR.exists():
+        return
+
+    now = time.time()
+    for pattern, max_age in (('*.wav', max_age_days * 24 * 60 * 60), ('*.part', 24 * 60 * 60)):
+        for cached_file in AUDIO_CACHE_DIR.glob(pattern):
+            try:
+                if cached_file.stat().st_mtime < now - max_age:
+                    cached_file.unlink()
+            except OSError as e:
+                print(f"Error cleaning audio cache: {e}")
 
 
 def load_audio_file(file_path: str) -> Optional[str]:
@@ -18,26 +131,37 @@ def load_audio_file(file_path: str) -> Optional[str]:
         return None
     
     try:
+        # Already normalized audio needs no conversion at all
+        if is_whisper_ready(file_path):
+            return file_path
+
         # Check if file is already in a supported format
         ext = Path(file_path).suffix.lower()
         supported_formats = ['.wav', '.mp3', '.m4a', '.flac', '.ogg']
         
-        if ext in supported_formats:
+        if ext in supported_formats and ext not in ['.m4a', '.webm']:
             # For most formats, Whisper can handle them directly
-            # But we might need to convert some formats
-            if ext in ['.m4a', '.webm']:
-                # Convert to wav for better compatibility
-                audio = AudioSegment.from_file(file_path)
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                audio.export(temp_file.name, format='wav')
-                return temp_file.name
             return file_path
-        else:
-            # Try to convert unknown formats
-            audio = AudioSegment.from_file(file_path)
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            audio.export(temp_file.name, format='wav')
-            return temp_file.name
+
+        # Reuse a previous conversion of the same file
+        AUDIO_CACHE_DIR.mkdir(exist_ok=True)
+        cached_file = AUDIO_CACHE_DIR / f"{get_cache_key(file_path)}.wav"
+        if cached_file.exists():
+            os.utime(cached_file)  # Mark as recently used
+            return str(cached_file)
+
+        # Convert to wav for better compatibility. Each conversion writes
+        # its own temporary file so concurrent loads of one file never clash
+        fd, partial_path = tempfile.mkstemp(suffix='.part', dir=AUDIO_CACHE_DIR)
+        os.close(fd)
+        try:
+            if not convert_to_wav(file_path, partial_path):
+                return None
+            os.replace(partial_path, cached_file)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        return str(cached_file)
     except Exception as e:
         print(f"Error loading audio file: {e}")
         return None
@@ -58,13 +182,8 @@ def get_audio_info(file_path: str) -> dict:
     if os.path.exists(file_path):
         info['exists'] = True
         info['file_size'] = os.path.getsize(file_path)
-        
-        try:
-            audio = AudioSegment.from_file(file_path)
-            info['duration'] = len(audio) / 1000.0  # Duration in seconds
-            info['format'] = Path(file_path).suffix.lower()
-        except Exception:
-            info['duration'] = None
-            info['format'] = None
+
+        info['duration'] = get_audio_duration(file_path)  # Duration in seconds
+        info['format'] = Path(file_path).suffix.lower() if info['duration'] is not None else None
     
     return info
@@ -5,8 +5,65 @@ History management for transcription results
 import os
 import json
 import time
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator
+from PyQt5.QtCore import QCoreApplication, QRunnable, QThreadPool, QTimer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Columns kept in memory for every item; text and segments stay on disk
+SUMMARY_FIELDS = ('id', 'timestamp', 'date', 'file_name', 'file_path', 'language')
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS history (
+    id TEXT PRIMARY KEY,
+    timestamp REAL,
+    date TEXT,
+    file_name TEXT,
+    file_path TEXT,
+    language TEXT,
+    record BLOB NOT NULL
+)
+"""
+
+
+def encode_record(result: Dict[str, Any]) -> bytes:
+    """Serialize a history record to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(result, ensure_ascii=False).encode('utf-8')
+
+
+def decode_record(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes into a history record"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def summarize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the lightweight summary of a history record"""
+    return {field: result.get(field) for field in SUMMARY_FIELDS}
+
+
+class HistoryWriteTask(QRunnable):
+    """Runnable that performs a single history write off the UI thread"""
+
+    def __init__(self, write: Callable[[], None]):
+        super().__init__()
+        self.write = write
+
+    def run(self):
+        self.write()
 
 
 class HistoryManager:
@@ -17,37 +74,143 @@ class HistoryManager:
         Initialize history manager.
         
         Args:
-            history_file: Path to JSON file for persistent storage.
+            history_file: Path to SQLite database for persistent storage.
                          If None, uses default location in user's data directory.
         """
+        legacy_files = []
         if history_file is None:
             # Use default location in user's home directory
             home = Path.home()
             data_dir = home / '.see_my_speech'
             data_dir.mkdir(exist_ok=True)
-            history_file = str(data_dir / 'transcription_history.json')
+            history_file = str(data_dir / 'history.db')
+            legacy_files = [
+                data_dir / 'transcription_history.jsonl',
+                data_dir / 'transcription_history.json',
+            ]
         
         self.history_file = history_file
-        self.history: List[Dict[str, Any]] = []
+        # Summaries keyed by id, in insertion order
+        self.history: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # The connection is shared between the UI thread (reads) and the
+        # write thread, so every use goes through the lock
+        self._io_lock = threading.Lock()
+        self._db = sqlite3.connect(history_file, check_same_thread=False)
+        self._db.execute(CREATE_TABLE)
+        self._db.commit()
+
+        # Writes run on a single background thread so they stay in order
+        self._io_pool = QThreadPool()
+        self._io_pool.setMaxThreadCount(1)
+
+        # New records are collected and inserted at most once per interval.
+        # Records stay in _unsaved until their insert has been committed.
+        self._pending_records: List[Dict[str, Any]] = []
+        self._unsaved: Dict[str, Dict[str, Any]] = {}
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(500)
+        self._flush_timer.timeout.connect(self.flush)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
         self.load_history()
 
+        # Migrate history saved by older versions as JSON or JSON Lines files
+        for legacy_file in legacy_files:
+            if not self.history and legacy_file.exists():
+                self.migrate_legacy_history(str(legacy_file))
+
     def load_history(self):
-        """Load history from file"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.history = json.load(f)
-            except Exception as e:
-                print(f"Error loading history: {e}")
-                self.history = []
+        """Load history summaries from the database"""
+        try:
+            with self._io_lock:
+                rows = self._db.execute(
+                    f"SELECT {', '.join(SUMMARY_FIELDS)} FROM history ORDER BY rowid"
+                ).fetchall()
+            self.history = OrderedDict(
+                (row[0], dict(zip(SUMMARY_FIELDS, row))) for row in rows
+            )
+        except Exception as e:
+            print(f"Error loading history: {e}")
+            self.history = OrderedDict()
 
-    def save_history(self):
-        """Save history to file"""
+    def migrate_legacy_history(self, legacy_file: str):
+        """Import a legacy JSON array or JSON Lines history file into the database"""
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            with open(legacy_file, 'rb') as f:
+                data = f.read()
+            if data.lstrip().startswith(b'['):
+                records = decode_record(data)
+            else:
+                records = [decode_record(line) for line in data.splitlines() if line.strip()]
+
+            for result in records:
+                result.setdefault('id', uuid.uuid4().hex)
+
+            # Only delete the legacy file once its records are committed
+            self._insert_records(records, raise_errors=True)
         except Exception as e:
-            print(f"Error saving history: {e}")
+            print(f"Error migrating history: {e}")
+            return
+
+        for result in records:
+            self.history[result['id']] = summarize(result)
+        try:
+            os.remove(legacy_file)
+        except OSError as e:
+            print(f"Error removing migrated history file: {e}")
+
+    def flush(self):
+        """Insert all queued records in the background"""
+        self._flush_timer.stop()
+        if not self._pending_records:
+            return
+
+        records = self._pending_records
+        self._pending_records = []
+        self._run_in_background(lambda: self._insert_records(records))
+
+    def wait_for_pending_writes(self):
+        """Flush queued records and block until all history writes have finished"""
+        self.flush()
+        self._io_pool.waitForDone()
+
+    def _run_in_background(self, write: Callable[[], None]):
+        self._io_pool.start(HistoryWriteTask(write))
+
+    def _insert_records(self, records: List[Dict[str, Any]], raise_errors: bool = False):
+        """Insert records into the database, raising on failure if raise_errors"""
+        rows = [
+            tuple(result.get(field) for field in SUMMARY_FIELDS) + (encode_record(result),)
+            for result in records
+        ]
+        with self._io_lock:
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._db.commit()
+            except Exception as e:
+                if raise_errors:
+                    self._db.rollback()
+                    raise
+                print(f"Error saving history: {e}")
+            finally:
+                for result in records:
+                    self._unsaved.pop(result['id'], None)
+
+    def _execute(self, sql: str, params: tuple = ()):
+        """Run a single write statement"""
+        with self._io_lock:
+            try:
+                self._db.execute(sql, params)
+                self._db.commit()
+            except Exception as e:
+                print(f"Error saving history: {e}")
 
     def add_transcription(self, result: Dict[str, Any]):
         """
@@ -60,55 +223,114 @@ class HistoryManager:
                    - file_path: Path to source audio file
                    - file_name: Name of source audio file
                    - segments: (optional) Transcription segments
+
+        Returns:
+            The id assigned to the new history item
         """
-        # Add timestamp
+        # Add id and timestamp
+        result['id'] = uuid.uuid4().hex
         result['timestamp'] = time.time()
         result['date'] = time.strftime('%Y-%m-%d %H:%M:%S')
         
-        self.history.append(result)
-        self.save_history()
+        self.history[result['id']] = summarize(result)
+        self._unsaved[result['id']] = result
+        self._pending_records.append(result)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        return result['id']
 
-    def get_history(self) -> List[Dict[str, Any]]:
-        """Get all transcription history"""
-        return self.history.copy()
+    def get_history(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get full transcription history items, optionally only a page of them.
+
+        Args:
+            offset: Index of the first item to return
+            limit: Maximum number of items to return, or None for all
+
+        Returns:
+            List of history items
+        """
+        end = None if limit is None else offset + limit
+        items = (self.get_item(item_id) for item_id in islice(self.history, offset, end))
+        return [item for item in items if item is not None]
+
+    def count(self) -> int:
+        """Get the number of items in history"""
+        return len(self.history)
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over history summaries (everything except text and segments)"""
+        return iter(self.history.values())
+
+    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Get a full history item by id, loading it from the database"""
+        if item_id not in self.history:
+            return None
+
+        result = self._unsaved.get(item_id)
+        if result is not None:
+            return result
+
+        with self._io_lock:
+            row = self._db.execute(
+                "SELECT record FROM history WHERE id = ?", (item_id,)
+            ).fetchone()
+        return decode_record(row[0]) if row else None
 
     def clear_history(self):
         """Clear all transcription history"""
+        self._flush_timer.stop()
+        self._pending_records = []
+        self._unsaved.clear()
         self.history.clear()
-        self.save_history()
+        self._run_in_background(lambda: self._execute("DELETE FROM history"))
 
-    def remove_item(self, index: int):
-        """Remove a specific item from history by index"""
-        if 0 <= index < len(self.history):
-            self.history.pop(index)
-            self.save_history()
+    def remove_item(self, item_id: str):
+        """Remove a specific item from history by id"""
+        if item_id in self.history:
+            del self.history[item_id]
+            self._unsaved.pop(item_id, None)
+            self._pending_records = [
+                result for result in self._pending_records if result['id'] != item_id
+            ]
+            self._run_in_background(
+                lambda: self._execute("DELETE FROM history WHERE id = ?", (item_id,))
+            )
 
-    def export_item(self, index: int, output_path: str) -> bool:
+    def export_item(self, item_id: str, output_path: str) -> bool:
         """
         Export a history item to a text file.
         
         Args:
-            index: Index of history item to export
+            item_id: Id of history item to export
             output_path: Path where to save the exported file
             
         Returns:
             True if export was successful, False otherwise
         """
-        if not (0 <= index < len(self.history)):
+        result = self.get_item(item_id)
+        if result is None:
             return False
         
+        lines = [
+            f"File: {result.get('file_name', 'Unknown')}",
+            f"Language: {result.get('language', 'Unknown')}",
+            f"Date: {result.get('date', 'Unknown')}",
+        ]
+        if 'file_path' in result:
+            lines.append(f"Path: {result['file_path']}")
+        lines.extend(["", "Transcription:", result.get('text', '')])
+
+        # Write to a temporary file first so an interrupted export never
+        # leaves a half-written file behind
+        temp_path = output_path + ".tmp"
         try:
-            result = self.history[index]
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"File: {result.get('file_name', 'Unknown')}\n")
-                f.write(f"Language: {result.get('language', 'Unknown')}\n")
-                f.write(f"Date: {result.get('date', 'Unknown')}\n")
-                if 'file_path' in result:
-                    f.write(f"Path: {result['file_path']}\n")
-                f.write("\nTranscription:\n")
-                f.write(result.get('text', ''))
-            
+            with open(temp_path, 'wb') as f:
+                f.write("\n".join(lines).encode('utf-8'))
+            os.replace(temp_path, output_path)
             return True
         except Exception as e:
             print(f"Error exporting history item: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
@@ -0,0 +1,48 @@
+"""
+In-memory cache in front of QSettings
+"""
+
+from typing import Any, Dict, Set
+
+
+class CachedSettings:
+    """
+    Wraps a QSettings object so repeated reads are served from memory and
+    writes are only collected until flush(). On Windows every QSettings
+    access goes to the registry.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+
+    def value(self, key: str, default: Any = None, type: Any = None) -> Any:
+        """Get a setting, reading QSettings only the first time"""
+        if key in self._cache:
+            return self._cache[key]
+
+        # Missing keys are not cached so callers can pass different defaults
+        if not self._settings.contains(key):
+            return default
+
+        if type is None:
+            value = self._settings.value(key, default)
+        else:
+            value = self._settings.value(key, default, type=type)
+        self._cache[key] = value
+        return value
+
+    def setValue(self, key: str, value: Any):
+        """Set a setting in memory; it is written to QSettings on flush()"""
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def flush(self):
+        """Write changed settings to QSettings"""
+        for key in self._dirty:
+            self._settings.setValue(key, self._cache[key])
+        self._dirty.clear()
+        self._settings.sync()
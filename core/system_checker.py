@@ -2,20 +2,123 @@
 System capability checker for Whisper transcription
 """
 
+import os
 import sys
-import torch
-import psutil
+import shutil
+import platform
+from functools import lru_cache
+from importlib import metadata, util
+
+
+def get_available_ram():
+    """Get available RAM in bytes using the native OS interface"""
+    if sys.platform.startswith('linux'):
+        meminfo = {}
+        with open('/proc/meminfo') as f:
+            for line in f:
+                name, value = line.split(':', 1)
+                meminfo[name] = int(value.split()[0]) * 1024
+        if 'MemAvailable' in meminfo:
+            return meminfo['MemAvailable']
+        # Kernels before 3.14 have no MemAvailable
+        return meminfo.get('MemFree', 0) + meminfo.get('Cached', 0)
+
+    if sys.platform == 'win32':
+        import ctypes
+
+        class MemoryStatusEx(ctypes.Structure):
+            _fields_ = [
+                ('dwLength', ctypes.c_ulong),
+                ('dwMemoryLoad', ctypes.c_ulong),
+                ('ullTotalPhys', ctypes.c_ulonglong),
+                ('ullAvailPhys', ctypes.c_ulonglong),
+                ('ullTotalPageFile', ctypes.c_ulonglong),
+                ('ullAvailPageFile', ctypes.c_ulonglong),
+                ('ullTotalVirtual', ctypes.c_ulonglong),
+                ('ullAvailVirtual', ctypes.c_ulonglong),
+                ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+            ]
+
+        status = MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(MemoryStatusEx)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+        return 0
+
+    # Other platforms; psutil is only installed there
+    try:
+        import psutil
+    except ImportError:
+        return 0
+    return psutil.virtual_memory().available
+
+
+def cuda_driver_present():
+    """Cheap check for an NVIDIA driver before asking torch to probe CUDA"""
+    if os.environ.get('CUDA_VISIBLE_DEVICES') == '':
+        return False
+
+    if shutil.which('nvidia-smi'):
+        return True
+
+    if sys.platform == 'win32':
+        system_root = os.environ.get('SystemRoot', r'C:\Windows')
+        return os.path.exists(os.path.join(system_root, 'System32', 'nvcuda.dll'))
+
+    return os.path.exists('/proc/driver/nvidia/version')
+
+
+def get_package_version(name):
+    """
+    Get an installed package's version without importing it. Frozen builds
+    may ship the package without its metadata, which reports 'unknown'.
+    """
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown' if util.find_spec(name) is not None else 'not installed'
+
+
+def hardware_fingerprint():
+    """
+    Cheap identifier of the machine and whether an NVIDIA driver is present,
+    used to tell when cached GPU probe results are stale.
+    """
+    return f"{platform.node()}|{platform.machine()}|{cuda_driver_present()}"
+
+
+@lru_cache(maxsize=1)
+def probe_gpu():
+    """
+    Probe CUDA once per process.
+    Returns a (device, gpu_name, gpu_memory) tuple.
+    """
+    if not cuda_driver_present():
+        return 'cpu', None, 0
+
+    import torch
+    if not torch.cuda.is_available():
+        return 'cpu', None, 0
+
+    return (
+        'cuda',
+        torch.cuda.get_device_name(),
+        torch.cuda.get_device_properties(0).total_memory / 1e9
+    )
 
 
 class SystemChecker:
     """Check system capabilities and recommend settings"""
 
     @staticmethod
-    def check_system():
-        """Check system capabilities"""
+    def check_system_fast():
+        """
+        Check everything that is cheap to probe (versions, RAM).
+        The device is reported as CPU until check_system_gpu() is merged in.
+        """
         info = {
             'python_version': sys.version,
-            'torch_version': torch.__version__,
+            'torch_version': get_package_version('torch'),
             'device': 'cpu',
             'gpu_name': None,
             'gpu_memory': 0,
@@ -23,15 +126,8 @@ class SystemChecker:
             'recommended_model': 'base'
         }
 
-        # Check GPU
-        if torch.cuda.is_available():
-            info['device'] = 'cuda'
-            info['gpu_name'] = torch.cuda.get_device_name()
-            info['gpu_memory'] = torch.cuda.get_device_properties(0).total_memory / 1e9
-
         # Check RAM
-        memory = psutil.virtual_memory()
-        info['ram_available'] = memory.available / 1e9
+        info['ram_available'] = get_available_ram() / 1e9
 
         # Recommend model size
         if info['ram_available'] < 4:
@@ -44,3 +140,19 @@ class SystemChecker:
             info['recommended_model'] = 'medium'
 
         return info
+
+    @staticmethod
+    def check_system_gpu():
+        """
+        Check GPU capabilities. This may initialize CUDA, so callers should
+        run it after the window is shown. The probe is cached per process.
+        """
+        device, gpu_name, gpu_memory = probe_gpu()
+        return {'device': device, 'gpu_name': gpu_name, 'gpu_memory': gpu_memory}
+
+    @staticmethod
+    def check_system():
+        """Check system capabilities"""
+        info = SystemChecker.check_system_fast()
+        info.update(SystemChecker.check_system_gpu())
+        return info
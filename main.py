@@ -4,13 +4,29 @@ Whisper Audio Transcription - Qt Desktop Application
 Cross-platform desktop app for local audio transcription
 """
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from ui.main_window import AudioTranscriptionApp
+from PyQt5.QtWidgets import QApplication, QSplashScreen
+from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtCore import Qt
+
+
+def create_splash_screen():
+    """Create a lightweight splash screen shown while the UI modules load"""
+    pixmap = QPixmap(400, 200)
+    pixmap.fill(QColor("#4CAF50"))
+
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Loading See My Speech...", Qt.AlignCenter, Qt.white)
+    return splash
 
 
 def main():
     """Main application entry point"""
+    # Let the CUDA caching allocator grow segments instead of fragmenting
+    # when switching between model sizes. Must be set before torch uses CUDA.
+    os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:True,max_split_size_mb:512')
+
     app = QApplication(sys.argv)
 
     # Set application properties
@@ -18,9 +34,17 @@ def main():
     app.setApplicationVersion("1.0")
     app.setOrganizationName("AudioTranscription")
 
+    # Show splash screen before importing the heavy UI module tree
+    splash = create_splash_screen()
+    splash.show()
+    app.processEvents()
+
+    from ui.main_window import AudioTranscriptionApp
+
     # Create and show main window
     window = AudioTranscriptionApp()
     window.show()
+    splash.finish(window)
 
     # Run application
     sys.exit(app.exec_())
@@ -0,0 +1,60 @@
+"""
+Tests for merging chunked transcription results
+"""
+
+import unittest
+
+from workers.backends import CHUNK_SECONDS, CHUNK_OVERLAP_SECONDS, merge_chunk_results
+
+
+def chunk_result(segments):
+    return {
+        'language': 'en',
+        'segments': [
+            {'start': start, 'end': end, 'text': f" {text}"}
+            for start, end, text in segments
+        ],
+    }
+
+
+class MergeChunkResultsTest(unittest.TestCase):
+    def test_keeps_segment_crossing_chunk_boundary(self):
+        lead = CHUNK_OVERLAP_SECONDS
+        results = [
+            chunk_result([(0, 24, "A"), (24, CHUNK_SECONDS, "B")]),
+            chunk_result([(0, lead + 5, "C"), (lead + 5, lead + 10, "D")]),
+        ]
+
+        merged = merge_chunk_results(results)
+
+        self.assertEqual(merged['text'], " A B C D")
+        self.assertEqual(
+            [(segment['start'], segment['end']) for segment in merged['segments']],
+            [(0, 24), (24, CHUNK_SECONDS), (CHUNK_SECONDS - lead, CHUNK_SECONDS + 5),
+             (CHUNK_SECONDS + 5, CHUNK_SECONDS + 10)]
+        )
+
+    def test_drops_segment_inside_leading_overlap(self):
+        results = [
+            chunk_result([(0, CHUNK_SECONDS, "A")]),
+            chunk_result([(0, CHUNK_OVERLAP_SECONDS, "a"), (CHUNK_OVERLAP_SECONDS, 10, "B")]),
+        ]
+
+        self.assertEqual(merge_chunk_results(results)['text'], " A B")
+
+    def test_continuous_speech_leaves_no_gaps(self):
+        # Every chunk is covered by back-to-back 6 s segments starting at 0
+        results = [
+            chunk_result([(start, start + 6, "x") for start in range(0, CHUNK_SECONDS, 6)])
+            for _ in range(3)
+        ]
+
+        segments = merge_chunk_results(results)['segments']
+
+        for previous, segment in zip(segments, segments[1:]):
+            self.assertLessEqual(segment['start'], previous['end'])
+        self.assertGreaterEqual(segments[-1]['end'], 3 * CHUNK_SECONDS - CHUNK_OVERLAP_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,32 +3,94 @@ Main application window for Whisper Audio Transcription
 """
 
 import os
-import time
+import gc
 import sys
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QTextEdit, QFileDialog, QProgressBar,
-    QComboBox, QCheckBox, QTabWidget, QListWidget, QListWidgetItem,
-    QGroupBox, QGridLayout, QMessageBox, QStatusBar
+    QComboBox, QCheckBox, QTabWidget, QListView,
+    QGroupBox, QGridLayout, QMessageBox, QStatusBar, QApplication
+)
+from PyQt5.QtCore import (
+    Qt, QSettings, QTimer, QThreadPool, QSignalBlocker, QAbstractListModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QSettings
 
-from core.system_checker import SystemChecker
+from core.system_checker import SystemChecker, hardware_fingerprint
 from workers.transcription_worker import TranscriptionWorker
 from workers.model_loader import ModelLoader
-from core.history_manager import HistoryManager
+from workers.system_check import SystemCheckTask
+from workers.backends import (
+    BACKENDS, DEFAULT_BACKEND, ACCURACY_MODES, FAST_MODE, release_cuda_memory,
+    faster_whisper_compute_type
+)
+from core.history_manager import HistoryManager, summarize
+from core.settings import CachedSettings
+from core.audio_utils import cleanup_audio_cache
 from ui.themes import LIGHT_THEME, DARK_THEME
 
 
+class HistoryModel(QAbstractListModel):
+    """List model over history summaries; full records are loaded on demand"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{row.get('file_name', 'Unknown')} - {row.get('language', 'Unknown')} - {row.get('date', 'Unknown')}"
+        if role == Qt.UserRole:
+            return row['id']
+        return None
+
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def append_row(self, row):
+        """Append one summary row"""
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_rows([])
+
+
 class AudioTranscriptionApp(QMainWindow):
     """Main application window"""
 
+    _AUDIO_FILTER = "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.mp4 *.webm);;All Files (*)"
+    _TEXT_FILTER = "Text Files (*.txt);;All Files (*)"
+
+    # Number of loaded models kept around for switching back without reloading
+    _MODEL_CACHE_SIZE = 2
+
+    # How long GPU probe results stored in the settings stay valid (seconds)
+    _GPU_INFO_TTL = 24 * 60 * 60
+
     def apply_theme(self, theme_name):
-        if theme_name == "dark":
-            self.setStyleSheet(DARK_THEME)
-        else:
-            self.setStyleSheet(LIGHT_THEME)
+        # Re-applying a stylesheet restyles every widget, so skip repeats
+        if theme_name == self._current_theme:
+            return
 
+        # Applied once at application level instead of per window
+        QApplication.instance().setStyleSheet(DARK_THEME if theme_name == "dark" else LIGHT_THEME)
+        self._current_theme = theme_name
         self.settings.setValue("theme", theme_name)
 
     def on_theme_changed(self, theme_name):
@@ -39,11 +101,46 @@ class AudioTranscriptionApp(QMainWindow):
         self.model = None
         self.transcription_worker = None
         self.model_loader = None
-        self.system_info = SystemChecker.check_system()
-        self.transcription_history = []
 
-        # Settings
-        self.settings = QSettings('WhisperTranscription', 'TranscriptionApp')
+        # Model loading and transcription share a small pool of reused threads
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._selected_stat = None
+        self._current_theme = None
+
+        # Recently loaded models by (size, device, backend, cpu_int8), oldest first
+        self._model_cache = OrderedDict()
+
+        # Model requested while another one was still loading
+        self._queued_model_size = None
+
+        # Only load the last model picked when scrolling through the combo box
+        self._model_debounce = QTimer(self)
+        self._model_debounce.setSingleShot(True)
+        self._model_debounce.setInterval(400)
+        self._model_debounce.timeout.connect(self.apply_model_selection)
+
+        # Polls a cancelled transcription worker until it has unwound
+        self._cancel_poll = QTimer(self)
+        self._cancel_poll.setInterval(100)
+        self._cancel_poll.timeout.connect(self.check_transcription_cancelled)
+
+        # Settings (kept in memory and written back on close)
+        self.settings = CachedSettings(QSettings('WhisperTranscription', 'TranscriptionApp'))
+
+        # GPU detection can initialize CUDA, so unless a recent result is
+        # cached it runs on a pool thread while the UI is built; the model
+        # is loaded as soon as the device is known
+        self.system_info = SystemChecker.check_system_fast()
+        gpu_info = self.load_cached_gpu_info()
+        if gpu_info is not None:
+            self.system_info.update(gpu_info)
+            QTimer.singleShot(0, lambda: self.finish_startup(gpu_info))
+        else:
+            self._system_check = SystemCheckTask()
+            self._system_check.signals.finished.connect(self.save_gpu_info_cache)
+            self._system_check.signals.finished.connect(self.finish_startup)
+            QThreadPool.globalInstance().start(self._system_check)
 
         # History manager
         self.history_manager = HistoryManager()
@@ -52,8 +149,12 @@ class AudioTranscriptionApp(QMainWindow):
         self.load_settings()
         self.load_history()
 
-        # Auto-load recommended model
-        self.load_model(self.system_info['recommended_model'])
+    def finish_startup(self, gpu_info):
+        """Load the model once GPU detection has finished"""
+        self.on_system_checked(gpu_info)
+
+        # Load the saved model (the recommended one on first run)
+        self.load_model(self.model_combo.currentText())
 
     def init_ui(self):
         """Initialize user interface"""
@@ -124,10 +225,14 @@ class AudioTranscriptionApp(QMainWindow):
         self.translate_cb = QCheckBox("Translate to English")
         self.timestamps_cb = QCheckBox("Include timestamps")
         self.timestamps_cb.setChecked(True)
+        self.vad_cb = QCheckBox("Skip silence")
+        self.vad_cb.setChecked(True)
+        self.vad_cb.setToolTip("Detect speech first and only transcribe the parts that contain it")
 
         options_layout.addWidget(self.auto_detect_cb)
         options_layout.addWidget(self.translate_cb)
         options_layout.addWidget(self.timestamps_cb)
+        options_layout.addWidget(self.vad_cb)
         options_layout.addStretch()
 
         file_layout.addLayout(options_layout)
@@ -157,6 +262,7 @@ class AudioTranscriptionApp(QMainWindow):
 
         # Transcription text
         self.transcription_text = QTextEdit()
+        self.transcription_text.setAcceptRichText(False)
         self.transcription_text.setPlaceholderText("Transcription will appear here...")
         results_layout.addWidget(self.transcription_text)
 
@@ -185,8 +291,12 @@ class AudioTranscriptionApp(QMainWindow):
         layout = QHBoxLayout(tab)
 
         # History list
-        self.history_list = QListWidget()
-        self.history_list.itemClicked.connect(self.show_history_item)
+        # Only visible rows are painted, and rows hold summaries, not full results
+        self.history_model = HistoryModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.clicked.connect(self.show_history_item)
         layout.addWidget(self.history_list, 1)
 
         # History details
@@ -198,6 +308,7 @@ class AudioTranscriptionApp(QMainWindow):
 
         self.history_text = QTextEdit()
         self.history_text.setReadOnly(True)
+        self.history_text.setAcceptRichText(False)
         details_layout.addWidget(self.history_text)
 
         # History controls
@@ -238,6 +349,32 @@ class AudioTranscriptionApp(QMainWindow):
         self.reload_model_btn.clicked.connect(self.reload_current_model)
         model_layout.addWidget(self.reload_model_btn, 0, 2)
 
+        model_layout.addWidget(QLabel("Backend:"), 1, 0)
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(BACKENDS)
+        self.backend_combo.setCurrentText(DEFAULT_BACKEND)
+        self.backend_combo.setToolTip(
+            "faster-whisper runs int8 models and is several times faster; "
+            "openai-whisper is the reference implementation"
+        )
+        self.backend_combo.currentTextChanged.connect(self.on_backend_changed)
+        model_layout.addWidget(self.backend_combo, 1, 1)
+
+        model_layout.addWidget(QLabel("Accuracy:"), 2, 0)
+        self.accuracy_combo = QComboBox()
+        self.accuracy_combo.addItems(ACCURACY_MODES)
+        self.accuracy_combo.setCurrentText(FAST_MODE)
+        self.accuracy_combo.setToolTip(
+            "Fast uses greedy decoding; Accurate uses beam search and is several times slower"
+        )
+        model_layout.addWidget(self.accuracy_combo, 2, 1)
+
+        self.cpu_int8_cb = QCheckBox("CPU int8 acceleration")
+        self.cpu_int8_cb.setChecked(True)
+        self.cpu_int8_cb.setToolTip("Use int8 weights when running on the CPU (faster, less memory)")
+        self.cpu_int8_cb.toggled.connect(self.on_cpu_int8_changed)
+        model_layout.addWidget(self.cpu_int8_cb, 3, 0, 1, 2)
+
         layout.addWidget(model_group)
 
         # Output settings
@@ -340,105 +477,269 @@ class AudioTranscriptionApp(QMainWindow):
         """Refresh system information"""
         self.status_bar.showMessage("Refreshing system information...")
 
-        # Re-check system capabilities
-        self.system_info = SystemChecker.check_system()
+        # Re-check system capabilities without blocking the UI
+        self._system_check = SystemCheckTask(SystemChecker.check_system)
+        self._system_check.signals.finished.connect(self.save_gpu_info_cache)
+        self._system_check.signals.finished.connect(self.on_system_refreshed)
+        QThreadPool.globalInstance().start(self._system_check)
 
-        # Update the display
+    def on_system_checked(self, info):
+        """Merge results of a background system check and update the display"""
+        self.system_info.update(info)
         self.update_system_info_display()
 
+    def load_cached_gpu_info(self):
+        """Get the GPU probe result saved by a recent run on this machine, if any"""
+        if self.settings.value('sysinfo_cache_key') != hardware_fingerprint():
+            return None
+        if time.time() - self.settings.value('sysinfo_cache_ts', 0, type=float) > self._GPU_INFO_TTL:
+            return None
+
+        try:
+            return json.loads(self.settings.value('sysinfo_cache', ''))
+        except ValueError:
+            return None
+
+    def save_gpu_info_cache(self, info):
+        """Remember the GPU probe result for the next launches"""
+        if 'device' not in info:
+            return
+
+        gpu_info = {key: info[key] for key in ('device', 'gpu_name', 'gpu_memory')}
+        self.settings.setValue('sysinfo_cache', json.dumps(gpu_info))
+        self.settings.setValue('sysinfo_cache_ts', time.time())
+        self.settings.setValue('sysinfo_cache_key', hardware_fingerprint())
+
+    def on_system_refreshed(self, info):
+        """Handle a finished system info refresh"""
+        self.on_system_checked(info)
         self.status_bar.showMessage("System information refreshed", 3000)
 
     def load_settings(self):
         """Load application settings"""
+        # Model widgets are restored with signals blocked; the model is
+        # loaded once after startup instead of on every restored value
+        blockers = [
+            QSignalBlocker(self.model_combo),
+            QSignalBlocker(self.backend_combo),
+            QSignalBlocker(self.cpu_int8_cb),
+        ]
+
         # Load model preference
         saved_model = self.settings.value('model_size', self.system_info['recommended_model'])
         self.model_combo.setCurrentText(saved_model)
 
+        # Load backend preference
+        self.backend_combo.setCurrentText(self.settings.value('backend', DEFAULT_BACKEND))
+        self.cpu_int8_cb.setChecked(self.settings.value('cpu_int8', True, type=bool))
+
+        for blocker in blockers:
+            blocker.unblock()
+
         # Load other settings
         self.auto_detect_cb.setChecked(self.settings.value('auto_detect', True, type=bool))
         self.timestamps_cb.setChecked(self.settings.value('timestamps', True, type=bool))
+        self.vad_cb.setChecked(self.settings.value('vad', True, type=bool))
+        self.accuracy_combo.setCurrentText(self.settings.value('accuracy_mode', FAST_MODE))
 
         # load theme
         theme = self.settings.value("theme", "light")
+        blocker = QSignalBlocker(self.theme_combo)
         self.theme_combo.setCurrentText(theme)
+        blocker.unblock()
         self.apply_theme(theme)
 
     def load_history(self):
         """Load transcription history from history manager"""
-        saved_history = self.history_manager.get_history()
-        self.transcription_history = saved_history
-        
-        # Populate history list
-        for idx, result in enumerate(saved_history):
-            item_text = f"{result.get('file_name', 'Unknown')} - {result.get('language', 'Unknown')} - {result.get('date', 'Unknown')}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, idx)
-            self.history_list.addItem(item)
+        self.history_model.set_rows(self.history_manager.iter_history())
 
     def save_settings(self):
         """Save application settings"""
         self.settings.setValue('model_size', self.model_combo.currentText())
+        self.settings.setValue('backend', self.backend_combo.currentText())
+        self.settings.setValue('cpu_int8', self.cpu_int8_cb.isChecked())
         self.settings.setValue('auto_detect', self.auto_detect_cb.isChecked())
         self.settings.setValue('timestamps', self.timestamps_cb.isChecked())
+        self.settings.setValue('vad', self.vad_cb.isChecked())
+        self.settings.setValue('accuracy_mode', self.accuracy_combo.currentText())
 
     def browse_file(self):
         """Browse for audio file"""
+        # Start in the last used directory so the dialog does not list the home folder
+        last_dir = self.settings.value('last_open_dir', str(Path.home()))
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Audio File",
-            "",
-            "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.mp4 *.webm);;All Files (*)"
+            last_dir,
+            self._AUDIO_FILTER
         )
 
         if file_path:
+            self.settings.setValue('last_open_dir', str(Path(file_path).parent))
             self.file_path_label.setText(file_path)
             self.transcribe_btn.setEnabled(True)
 
+            # Stat once here so the worker does not have to
+            try:
+                self._selected_stat = os.stat(file_path)
+            except OSError:
+                self._selected_stat = None
+
     def browse_output_folder(self):
         """Browse for output folder"""
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        last_dir = self.settings.value('output_folder', str(Path.home()))
+        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder", last_dir)
         if folder:
             self.output_folder_label.setText(folder)
             self.settings.setValue('output_folder', folder)
 
+    def last_save_dir(self):
+        """Directory the save dialogs start in"""
+        return self.settings.value(
+            'last_save_dir', self.settings.value('output_folder', str(Path.home()))
+        )
+
     def load_model(self, model_size):
         """Load Whisper model"""
-        if self.model_loader and self.model_loader.isRunning():
+        if self.model_loader and self.model_loader.active:
+            # Let the running loader finish, discard its model, then load this one
+            self._queued_model_size = model_size
+            self.model_loader.cancel()
             return
 
+        key = self._model_key(model_size)
+        if key in self._model_cache:
+            self._model_cache.move_to_end(key)
+            self.model = self._model_cache[key]
+            self.status_bar.showMessage(f"Using loaded {model_size} model")
+            self.transcribe_btn.setEnabled(True)
+            return
+
+        # Make room first so at most _MODEL_CACHE_SIZE models are ever alive,
+        # counting the one about to be loaded
+        self.evict_cached_models(self._MODEL_CACHE_SIZE - 1)
+
         self.status_bar.showMessage(f"Loading {model_size} model...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
 
-        self.model_loader = ModelLoader(model_size, self.system_info['device'])
-        self.model_loader.progress.connect(self.update_status)
-        self.model_loader.finished.connect(self.on_model_loaded)
-        self.model_loader.error.connect(self.on_model_error)
-        self.model_loader.start()
+        # The compute type comes from the known GPU memory so the loader
+        # never has to probe the GPU itself
+        self.model_loader = ModelLoader(
+            model_size,
+            self.system_info['device'],
+            self.backend_combo.currentText(),
+            self.cpu_int8_cb.isChecked(),
+            faster_whisper_compute_type(
+                self.system_info['device'],
+                self.cpu_int8_cb.isChecked(),
+                self.system_info['gpu_memory']
+            )
+        )
+        self.model_loader.signals.progress.connect(self.update_status)
+        self.model_loader.signals.finished.connect(self.on_model_loaded)
+        self.model_loader.signals.error.connect(self.on_model_error)
+        self.model_loader.signals.cancelled.connect(self.start_queued_model_load)
+        self._pool.start(self.model_loader)
+
+    def _model_key(self, model_size):
+        """Cache key for a model of the given size with the current settings"""
+        return (
+            model_size,
+            self.system_info['device'],
+            self.backend_combo.currentText(),
+            self.cpu_int8_cb.isChecked()
+        )
+
+    def cache_model(self, key, model):
+        """Remember a loaded model, dropping the least recently used one if full"""
+        self._model_cache[key] = model
+        self._model_cache.move_to_end(key)
+        self.evict_cached_models(self._MODEL_CACHE_SIZE)
+
+    def evict_cached_models(self, keep):
+        """Drop least recently used models until at most keep remain"""
+        if len(self._model_cache) <= keep:
+            return
+
+        while len(self._model_cache) > keep:
+            self._model_cache.popitem(last=False)
+        gc.collect()
+        if self.system_info['device'] == 'cuda':
+            release_cuda_memory()
+
+    def start_queued_model_load(self):
+        """Start loading a model that was requested during a previous load"""
+        if self._queued_model_size is None:
+            return
+
+        model_size = self._queued_model_size
+        self._queued_model_size = None
+
+        # The previous loader has emitted its last signal
+        self.release_model()
+        self.load_model(model_size)
 
     def on_model_loaded(self, model):
         """Handle model loaded successfully"""
         self.model = model
+        loader = self.model_loader
+        self.cache_model((loader.model_size, loader.device, loader.backend, loader.cpu_int8), model)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Model loaded successfully")
         self.transcribe_btn.setEnabled(True)
+        self.start_queued_model_load()
 
     def on_model_error(self, error):
         """Handle model loading error"""
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Model loading failed")
+        self.start_queued_model_load()
         QMessageBox.critical(self, "Error", f"Failed to load model:\n{error}")
 
     def on_model_changed(self, model_size):
         """Handle model selection change"""
-        self.load_model(model_size)
         self.save_settings()
 
-    def reload_current_model(self):
-        """Reload current model"""
-        self.model = None
+        loading = self.model_loader is not None and self.model_loader.active
+        if not loading and self.model is not None and self.model.model_size == model_size:
+            # Back on the loaded model before the debounce fired
+            self._model_debounce.stop()
+            return
+
+        self._model_debounce.start()
+
+    def apply_model_selection(self):
+        """Load the model selected in the combo box once it stopped changing"""
+        self.release_model()
         self.load_model(self.model_combo.currentText())
 
+    def on_backend_changed(self, backend):
+        """Handle backend selection change"""
+        self.apply_model_selection()
+        self.save_settings()
+
+    def on_cpu_int8_changed(self, checked):
+        """Handle CPU int8 toggle (only affects models loaded on the CPU)"""
+        self.save_settings()
+        if self.system_info['device'] == 'cpu':
+            self.apply_model_selection()
+
+    def release_model(self):
+        """Drop the current model and return its memory before loading another"""
+        self.model = None
+        self.transcribe_btn.setEnabled(False)
+        gc.collect()
+        if self.system_info['device'] == 'cuda':
+            release_cuda_memory()
+
+    def reload_current_model(self):
+        """Reload current model from disk, bypassing the model cache"""
+        model_size = self.model_combo.currentText()
+        self.release_model()
+        self._model_cache.pop(self._model_key(model_size), None)
+        self.load_model(model_size)
+
     def start_transcription(self):
         """Start audio transcription"""
         if not self.file_path_label.text() or self.file_path_label.text() == "No file selected":
@@ -454,6 +755,8 @@ class AudioTranscriptionApp(QMainWindow):
             'auto_detect': self.auto_detect_cb.isChecked(),
             'translate': self.translate_cb.isChecked(),
             'timestamps': self.timestamps_cb.isChecked(),
+            'accuracy_mode': self.accuracy_combo.currentText(),
+            'vad': self.vad_cb.isChecked(),
             'language': None  # Auto-detect for now
         }
 
@@ -461,29 +764,40 @@ class AudioTranscriptionApp(QMainWindow):
         self.transcription_worker = TranscriptionWorker(
             self.model,
             self.file_path_label.text(),
-            settings
+            settings,
+            self._selected_stat
         )
 
-        self.transcription_worker.progress.connect(self.update_status)
-        self.transcription_worker.finished.connect(self.on_transcription_finished)
-        self.transcription_worker.error.connect(self.on_transcription_error)
+        self.transcription_worker.signals.progress.connect(self.update_progress)
+        self.transcription_worker.signals.finished.connect(self.on_transcription_finished)
+        self.transcription_worker.signals.error.connect(self.on_transcription_error)
 
-        self.transcription_worker.start()
+        self._pool.start(self.transcription_worker)
 
         # Update UI
         self.transcribe_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
 
     def cancel_transcription(self):
-        """Cancel ongoing transcription"""
-        if self.transcription_worker:
+        """Cancel ongoing transcription without blocking the UI"""
+        self.cancel_btn.setEnabled(False)
+        if self.transcription_worker and self.transcription_worker.active:
             self.transcription_worker.cancel()
-            self.transcription_worker.wait()
+            self.status_bar.showMessage("Cancelling transcription...")
+            self._cancel_poll.start()
+        else:
+            self.check_transcription_cancelled()
 
+    def check_transcription_cancelled(self):
+        """Restore the UI once the cancelled worker has stopped"""
+        if self.transcription_worker and self.transcription_worker.active:
+            return
+
+        self._cancel_poll.stop()
         self.transcribe_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Transcription cancelled")
 
@@ -495,7 +809,7 @@ class AudioTranscriptionApp(QMainWindow):
 
         # Update UI
         self.language_label.setText(f"Language: {result['language']}")
-        self.transcription_text.setText(result['text'])
+        self.transcription_text.setPlainText(result['text'])
 
         # Enable save buttons
         self.save_txt_btn.setEnabled(True)
@@ -519,24 +833,35 @@ class AudioTranscriptionApp(QMainWindow):
         """Update status bar message"""
         self.status_bar.showMessage(message)
 
+    def update_progress(self, percent, message):
+        """Show transcription progress in the status bar and progress bar"""
+        self.status_bar.showMessage(message)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
     def save_as_txt(self):
         """Save transcription as text file"""
-        if not self.transcription_text.toPlainText():
+        # toPlainText() copies the whole document, so only call it once
+        text = self.transcription_text.toPlainText()
+        if not text:
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Transcription",
-            "transcription.txt",
-            "Text Files (*.txt);;All Files (*)"
+            str(Path(self.last_save_dir()) / "transcription.txt"),
+            self._TEXT_FILTER
         )
 
         if file_path:
+            self.settings.setValue('last_save_dir', str(Path(file_path).parent))
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Language: {self.language_label.text()}\n\n")
-                    f.write("Transcription:\n")
-                    f.write(self.transcription_text.toPlainText())
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.writelines([
+                        f"Language: {self.language_label.text()}\n\n",
+                        "Transcription:\n",
+                        text
+                    ])
 
                 QMessageBox.information(self, "Success", f"Transcription saved to:\n{file_path}")
             except Exception as e:
@@ -544,26 +869,22 @@ class AudioTranscriptionApp(QMainWindow):
 
     def copy_to_clipboard(self):
         """Copy transcription to clipboard"""
-        from PyQt5.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(self.transcription_text.toPlainText())
         self.status_bar.showMessage("Copied to clipboard", 2000)
 
     def add_to_history(self, result):
         """Add transcription to history"""
-        self.transcription_history.append(result)
         self.history_manager.add_transcription(result)
 
         # Add to history list
-        item_text = f"{result['file_name']} - {result['language']} - {time.strftime('%Y-%m-%d %H:%M')}"
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.UserRole, len(self.transcription_history) - 1)
-        self.history_list.addItem(item)
+        self.history_model.append_row(summarize(result))
 
-    def show_history_item(self, item):
+    def show_history_item(self, index):
         """Show selected history item"""
-        index = item.data(Qt.UserRole)
-        result = self.transcription_history[index]
+        result = self.history_manager.get_item(index.data(Qt.UserRole))
+        if result is None:
+            return
 
         info_text = f"""
         <b>File:</b> {result['file_name']}<br>
@@ -572,27 +893,30 @@ class AudioTranscriptionApp(QMainWindow):
         """
 
         self.history_info.setText(info_text)
-        self.history_text.setText(result['text'])
+        self.history_text.setPlainText(result['text'])
         self.export_history_btn.setEnabled(True)
 
     def export_history_item(self):
         """Export selected history item"""
-        current_item = self.history_list.currentItem()
-        if not current_item:
+        current_index = self.history_list.currentIndex()
+        if not current_index.isValid():
             return
 
-        index = current_item.data(Qt.UserRole)
-        result = self.transcription_history[index]
+        item_id = current_index.data(Qt.UserRole)
+        result = self.history_manager.get_item(item_id)
+        if result is None:
+            return
 
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Transcription",
-            f"{os.path.splitext(result['file_name'])[0]}_transcription.txt",
-            "Text Files (*.txt);;All Files (*)"
+            str(Path(self.last_save_dir()) / f"{os.path.splitext(result['file_name'])[0]}_transcription.txt"),
+            self._TEXT_FILTER
         )
 
         if file_path:
-            if self.history_manager.export_item(index, file_path):
+            self.settings.setValue('last_save_dir', str(Path(file_path).parent))
+            if self.history_manager.export_item(item_id, file_path):
                 QMessageBox.information(self, "Success", f"Exported to:\n{file_path}")
             else:
                 QMessageBox.critical(self, "Error", "Failed to export history item")
@@ -607,8 +931,7 @@ class AudioTranscriptionApp(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            self.transcription_history.clear()
-            self.history_list.clear()
+            self.history_model.clear()
             self.history_info.setText("Select an item to view details")
             self.history_text.clear()
             self.export_history_btn.setEnabled(False)
@@ -617,13 +940,19 @@ class AudioTranscriptionApp(QMainWindow):
     def closeEvent(self, event):
         """Handle application close"""
         self.save_settings()
+        self.settings.flush()
 
         # Cancel any running operations
-        if self.transcription_worker and self.transcription_worker.isRunning():
+        if self.transcription_worker:
             self.transcription_worker.cancel()
-            self.transcription_worker.wait()
+        if self.model_loader:
+            self.model_loader.cancel()
+        self._pool.waitForDone()
+
+        # Make sure queued history writes reach the disk
+        self.history_manager.wait_for_pending_writes()
 
-        if self.model_loader and self.model_loader.isRunning():
-            self.model_loader.wait()
+        # Drop converted audio that has not been used recently
+        cleanup_audio_cache()
 
         event.accept()
@@ -1,8 +1,28 @@
 """
-Worker threads for background processing
+Background tasks for model loading, transcription and system checks
 """
 
-from .transcription_worker import TranscriptionWorker
-from .model_loader import ModelLoader
+import importlib
 
-__all__ = ['TranscriptionWorker', 'ModelLoader']
+# Submodules are only imported when one of their names is first accessed,
+# so workers.backends can be used without loading Qt
+_lazy_imports = {
+    'TranscriptionWorker': '.transcription_worker',
+    'ModelLoader': '.model_loader',
+    'SystemCheckTask': '.system_check',
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
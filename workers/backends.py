@@ -0,0 +1,666 @@
+"""
+Transcription backends sharing a common interface.
+
+Each backend loads a model of a given size on a device and exposes
+load_audio(), which decodes a file to a float32 mono 16 kHz array, and
+transcribe(), which takes that array and returns a Whisper-style result
+dictionary with 'text', 'language' and 'segments' keys.
+
+transcribe() reports through progress(message, percent=None) and polls
+is_cancelled(); it may raise TranscriptionCancelled to stop early.
+"""
+
+import io
+import os
+import sys
+import types
+import threading
+import importlib
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+from core.audio_utils import WHISPER_SAMPLE_RATE
+
+OPENAI_WHISPER = 'openai-whisper'
+FASTER_WHISPER = 'faster-whisper'
+
+# Share of GPU memory the PyTorch backend may use, leaving room for the desktop
+CUDA_MEMORY_FRACTION = 0.85
+
+# Long files are split into overlapping windows; on the GPU these are
+# transcribed in parallel on CHUNK_WORKERS model workers
+LONG_AUDIO_SECONDS = 5 * 60
+CHUNK_SECONDS = 30
+CHUNK_OVERLAP_SECONDS = 1
+CHUNK_WORKERS = 2
+
+# Silence longer than this splits speech when skipping silent audio (VAD)
+VAD_MIN_SILENCE_MS = 500
+
+# GPUs with less memory than this (in GB) run faster-whisper with int8
+# weights and fp16 activations instead of full fp16
+LOW_VRAM_GB = 6
+
+# Parallel HTTP range requests used to fetch openai-whisper checkpoints,
+# and how long (seconds) a stalled connection may block before giving up
+DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_TIMEOUT = 30
+
+BACKENDS = [FASTER_WHISPER, OPENAI_WHISPER]
+DEFAULT_BACKEND = FASTER_WHISPER
+
+# Fast mode decodes greedily without conditioning on previous text;
+# accurate mode uses beam search, which costs roughly beam_size times more
+FAST_MODE = 'Fast'
+ACCURATE_MODE = 'Accurate'
+ACCURACY_MODES = [FAST_MODE, ACCURATE_MODE]
+
+
+def get_bundled_model_dir(model_size):
+    """
+    Return the directory of a model bundled with a frozen build, if any.
+    Frozen builds may ship pre-downloaded checkpoints in a 'whisper'
+    folder next to the bundled code to avoid the first-run download.
+    """
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir is None:
+        return None
+
+    model_dir = Path(bundle_dir) / 'whisper'
+    if (model_dir / f"{model_size}.pt").exists():
+        return str(model_dir)
+    return None
+
+
+def get_bundled_faster_whisper_model(model_size):
+    """
+    Return the path of a CTranslate2 model bundled with a frozen build, if
+    any. Frozen builds may ship converted models as 'faster-whisper/<size>'
+    folders (each holding model.bin) next to the bundled code.
+    """
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir is None:
+        return None
+
+    model_dir = Path(bundle_dir) / 'faster-whisper' / model_size
+    if (model_dir / 'model.bin').exists():
+        return str(model_dir)
+    return None
+
+
+def silent_audio(seconds=1):
+    """A short silent waveform used to warm up a freshly loaded model"""
+    import numpy as np
+    return np.zeros(WHISPER_SAMPLE_RATE * seconds, dtype=np.float32)
+
+
+def whisper_cache_dir():
+    """Default checkpoint directory used by whisper.load_model()"""
+    default = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+
+
+class LoadCancelled(Exception):
+    """Raised while fetching a model that is no longer wanted"""
+
+
+def download_checkpoint(model_size, progress, is_cancelled=lambda: False):
+    """
+    Download an openai-whisper checkpoint into whisper's cache over
+    DOWNLOAD_CONNECTIONS parallel range requests. whisper.load_model()
+    verifies the checksum afterwards. If the server does not support
+    ranges or anything fails, whisper downloads the file itself.
+    Raises LoadCancelled, removing the partial file, once is_cancelled().
+    """
+    import urllib.request
+    import whisper
+
+    url = whisper._MODELS.get(model_size)
+    if url is None:
+        return
+    target = os.path.join(whisper_cache_dir(), os.path.basename(url))
+    if os.path.isfile(target):
+        return
+
+    partial = target + ".part"
+    try:
+        with urllib.request.urlopen(
+            urllib.request.Request(url, method='HEAD'), timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            size = int(response.headers.get('Content-Length', 0))
+            accepts_ranges = response.headers.get('Accept-Ranges') == 'bytes'
+        if not size or not accepts_ranges:
+            return
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(partial, 'wb') as f:
+            f.truncate(size)
+
+        def fetch(start, end):
+            request = urllib.request.Request(url, headers={'Range': f"bytes={start}-{end}"})
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response, \
+                    open(partial, 'r+b') as f:
+                if response.status != 206:
+                    raise IOError("Server ignored the range request")
+                f.seek(start)
+                while True:
+                    if is_cancelled():
+                        raise LoadCancelled()
+                    block = response.read(1 << 20)
+                    if not block:
+                        break
+                    f.write(block)
+
+        part_size = -(-size // DOWNLOAD_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_CONNECTIONS) as executor:
+            futures = [
+                executor.submit(fetch, start, min(start + part_size, size) - 1)
+                for start in range(0, size, part_size)
+            ]
+            for number, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                progress(f"Downloading {model_size} model ({number}/{len(futures)} parts)...")
+
+        os.replace(partial, target)
+    except LoadCancelled:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    except Exception as e:
+        print(f"Parallel download failed, falling back to whisper: {e}")
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+class TranscriptionCancelled(Exception):
+    """Raised from inside a backend's decode loop when the user cancels"""
+
+
+# Progress and cancel callbacks of the transcription running on each thread
+_progress_local = threading.local()
+_progress_patch_lock = threading.Lock()
+_progress_patched = False
+
+
+def _install_progress_tqdm():
+    """
+    Replace the tqdm used by whisper.transcribe, once per process, with a
+    subclass that reports to the calling thread's whisper_progress()
+    callbacks. Threads without callbacks (such as a warm-up) get plain tqdm.
+    """
+    global _progress_patched
+
+    with _progress_patch_lock:
+        if _progress_patched:
+            return
+
+        import tqdm
+
+        class ProgressTqdm(tqdm.tqdm):
+            def __init__(self, *args, **kwargs):
+                if getattr(_progress_local, 'callbacks', None) is not None:
+                    kwargs['file'] = io.StringIO()  # Keep the console quiet
+                super().__init__(*args, **kwargs)
+
+            def update(self, n=1):
+                callbacks = getattr(_progress_local, 'callbacks', None)
+                if callbacks is None:
+                    return super().update(n)
+
+                progress, is_cancelled = callbacks
+                if is_cancelled():
+                    raise TranscriptionCancelled()
+                result = super().update(n)
+                if self.total:
+                    percent = min(100, int(self.n * 100 / self.total))
+                    progress(f"Transcribing... {percent}%", percent)
+                return result
+
+        # whisper/__init__.py re-exports the transcribe function under the
+        # same name, so fetch the submodule itself
+        transcribe_module = importlib.import_module('whisper.transcribe')
+        transcribe_module.tqdm = types.SimpleNamespace(tqdm=ProgressTqdm)
+        _progress_patched = True
+
+
+@contextmanager
+def whisper_progress(progress, is_cancelled):
+    """
+    Forward openai-whisper's internal tqdm progress on this thread to
+    progress() while active, and stop decoding at the next window once
+    is_cancelled(). Other threads' transcriptions are not affected.
+    """
+    _install_progress_tqdm()
+
+    previous = getattr(_progress_local, 'callbacks', None)
+    _progress_local.callbacks = (progress, is_cancelled)
+    try:
+        yield
+    finally:
+        _progress_local.callbacks = previous
+
+
+def release_cuda_memory():
+    """Return cached CUDA blocks to the driver after a model was dropped"""
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+@lru_cache(maxsize=2)
+def _decode_audio(audio_file, mtime_ns, size, decoder):
+    return decoder(audio_file)
+
+
+def decode_audio(audio_file, decoder):
+    """
+    Decode an audio file to a float32 mono 16 kHz array with the given decoder.
+    Recently decoded files are kept in memory (keyed by path, mtime and size)
+    so retries and re-runs skip ffmpeg entirely.
+    """
+    stat = os.stat(audio_file)
+    return _decode_audio(audio_file, stat.st_mtime_ns, stat.st_size, decoder)
+
+
+def split_into_chunks(audio):
+    """
+    Split a waveform at every CHUNK_SECONDS boundary. Each chunk after the
+    first also starts CHUNK_OVERLAP_SECONDS before its boundary, so speech
+    just before the cut gives the model some context.
+    """
+    step = CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+    overlap = CHUNK_OVERLAP_SECONDS * WHISPER_SAMPLE_RATE
+    return [
+        audio[max(0, boundary - overlap):boundary + step]
+        for boundary in range(0, len(audio), step)
+    ]
+
+
+def merge_chunk_results(results):
+    """
+    Merge per-chunk results from split_into_chunks() into one result.
+    Segment times are shifted by the chunk's start. Segments lying entirely
+    inside a chunk's leading overlap are dropped because the previous chunk
+    already covers that audio; segments crossing the boundary are kept,
+    since the previous chunk was cut there.
+    """
+    segments = []
+    for index, result in enumerate(results):
+        lead = CHUNK_OVERLAP_SECONDS if index else 0
+        offset = index * CHUNK_SECONDS - lead
+        for segment in result['segments']:
+            if index and segment['end'] <= lead:
+                continue
+            segments.append(dict(
+                segment,
+                id=len(segments),
+                start=segment['start'] + offset,
+                end=segment['end'] + offset
+            ))
+
+    return {
+        'text': "".join(segment['text'] for segment in segments),
+        'language': results[0]['language'] if results else None,
+        'segments': segments,
+    }
+
+
+def remove_silence(audio):
+    """
+    Cut silence out of a waveform with the Silero VAD model shipped with
+    faster-whisper. Returns the speech-only waveform and the (start, end)
+    sample spans it was built from, for restore_timestamps().
+    """
+    import numpy as np
+    from faster_whisper.vad import get_speech_timestamps
+
+    spans = [
+        (chunk['start'], chunk['end'])
+        for chunk in get_speech_timestamps(audio, min_silence_duration_ms=VAD_MIN_SILENCE_MS)
+    ]
+    if not spans:
+        return audio[:0], spans
+    return np.concatenate([audio[start:end] for start, end in spans]), spans
+
+
+def restore_timestamps(result, spans):
+    """Map segment times of a remove_silence() waveform back to the original audio"""
+    offsets = []
+    total = 0
+    for start, end in spans:
+        offsets.append(total)
+        total += end - start
+
+    def restore(seconds, bisect):
+        sample = seconds * WHISPER_SAMPLE_RATE
+        index = max(0, bisect(offsets, sample) - 1)
+        return (spans[index][0] + sample - offsets[index]) / WHISPER_SAMPLE_RATE
+
+    # A time exactly on a join between spans is the start of the later span
+    # but the end of the earlier one
+    for segment in result['segments']:
+        segment['start'] = restore(segment['start'], bisect_right)
+        segment['end'] = restore(segment['end'], bisect_left)
+    return result
+
+
+def quantize_linear_layers(model):
+    """
+    Dynamically quantize a Whisper model's linear layers to int8 for CPU.
+    openai-whisper uses its own Linear subclass, which quantize_dynamic
+    does not recognize, so those layers are first swapped for plain
+    nn.Linear modules sharing the same weights.
+    """
+    import torch
+    import whisper.model
+
+    def to_plain_linear(module):
+        for name, child in module.named_children():
+            if isinstance(child, whisper.model.Linear):
+                linear = torch.nn.Linear(
+                    child.in_features, child.out_features, bias=child.bias is not None
+                )
+                linear.weight = child.weight
+                linear.bias = child.bias
+                setattr(module, name, linear)
+            else:
+                to_plain_linear(child)
+
+    to_plain_linear(model)
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def faster_whisper_compute_type(device, cpu_int8=True, gpu_memory=0):
+    """
+    Pick the CTranslate2 compute type for a device: fp16 tensor cores on
+    GPUs with at least LOW_VRAM_GB of memory (gpu_memory, in GB), int8
+    weights on smaller or unknown GPUs and on the CPU.
+    """
+    if device == 'cuda':
+        return 'float16' if gpu_memory >= LOW_VRAM_GB else 'int8_float16'
+    return 'int8' if cpu_int8 else 'float32'
+
+
+class OpenAIWhisperBackend:
+    """Reference PyTorch implementation from openai-whisper"""
+
+    name = OPENAI_WHISPER
+
+    decode_options = {
+        FAST_MODE: dict(temperature=0, condition_on_previous_text=False),
+        ACCURATE_MODE: dict(beam_size=5, best_of=5),
+    }
+
+    def __init__(self, model_size, device, progress=None, cpu_int8=True,
+                 is_cancelled=lambda: False):
+        import whisper
+
+        download_root = get_bundled_model_dir(model_size)
+        if download_root is None and progress is not None:
+            download_checkpoint(model_size, progress, is_cancelled)
+
+        import torch
+        if device == 'cuda':
+            torch.cuda.set_per_process_memory_fraction(CUDA_MEMORY_FRACTION, 0)
+            # Whisper always feeds fixed 30 s windows, so let cuDNN pick
+            # the fastest algorithms for that shape once
+            torch.backends.cudnn.benchmark = True
+        else:
+            # Leave cores for the UI and decoding threads instead of
+            # oversubscribing them with intra-op threads
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+
+        self.model_size = model_size
+        self.device = device
+        self.model = whisper.load_model(
+            model_size,
+            device=device,
+            download_root=download_root
+        )
+
+        if device == 'cpu' and cpu_int8:
+            if progress is not None:
+                progress("Quantizing model to int8...")
+            try:
+                self.model = quantize_linear_layers(self.model)
+            except Exception as e:
+                print(f"Int8 quantization failed, using fp32 model: {e}")
+
+        # Page-locked staging buffer for GPU uploads, grown as needed, and
+        # an event marking when the last upload from it has finished
+        self._pinned_buffer = None
+        self._upload_done = None
+
+    def load_audio(self, audio_file):
+        """Decode the audio file for transcribe()"""
+        import whisper
+        return decode_audio(audio_file, whisper.load_audio)
+
+    def warm_up(self):
+        """
+        Run a short silent transcription so kernel selection and (on CUDA)
+        compilation happen now rather than on the user's first file.
+        """
+        import torch
+
+        if self.device == 'cuda' and hasattr(torch, 'compile'):
+            # Only the encoder is compiled: whisper installs fresh kv-cache
+            # hooks on the decoder for every window, which compiled graphs
+            # would not see
+            encoder = self.model.encoder
+            try:
+                self.model.encoder = torch.compile(encoder, mode='reduce-overhead', fullgraph=False)
+                self._warm_up_run()
+                return
+            except Exception:
+                # Compilation is optional, fall back to the eager encoder
+                self.model.encoder = encoder
+
+        self._warm_up_run()
+
+    def _warm_up_run(self):
+        import torch
+        with torch.inference_mode():
+            self.model.transcribe(silent_audio(), verbose=None, fp16=self.device == 'cuda')
+
+    def to_device(self, audio):
+        """
+        Copy the waveform to the GPU so Whisper computes the mel spectrogram
+        there instead of running the STFT on the CPU. The copy goes through
+        a reused pinned buffer; the device tensor is freed once the
+        transcription returns.
+        """
+        if self.device != 'cuda':
+            return audio
+
+        import torch
+
+        if self._upload_done is not None:
+            # The previous upload must finish before the buffer is overwritten
+            self._upload_done.synchronize()
+        if self._pinned_buffer is None or self._pinned_buffer.numel() < len(audio):
+            self._pinned_buffer = torch.empty(len(audio), dtype=torch.float32).pin_memory()
+
+        staging = self._pinned_buffer[:len(audio)]
+        staging.copy_(torch.from_numpy(audio))
+        tensor = staging.to(self.device, non_blocking=True)
+        self._upload_done = torch.cuda.Event()
+        self._upload_done.record()
+        return tensor
+
+    def transcribe(self, audio, language, task, progress, is_cancelled,
+                   accuracy_mode=FAST_MODE, vad=True):
+        """
+        Transcribe the whole waveform (half precision on GPU, full precision
+        on CPU). With vad, silent stretches are cut out before decoding.
+        """
+        options = self.decode_options[accuracy_mode]
+
+        spans = None
+        if vad:
+            progress("Detecting speech...")
+            audio, spans = remove_silence(audio)
+            if not spans:
+                return {'text': "", 'language': language or 'unknown', 'segments': []}
+
+        result = self._transcribe_audio(audio, language, task, options, progress, is_cancelled)
+        return restore_timestamps(result, spans) if spans else result
+
+    def _transcribe_audio(self, audio, language, task, options, progress, is_cancelled):
+        use_fp16 = self.device == 'cuda'
+        if use_fp16:
+            import torch
+            # Let remaining fp32 matmuls use TF32 tensor cores
+            torch.set_float32_matmul_precision('high')
+
+        audio = self.to_device(audio)
+
+        with whisper_progress(progress, is_cancelled):
+            try:
+                return self._transcribe(audio, language, task, options, fp16=use_fp16)
+            except RuntimeError:
+                if not use_fp16:
+                    raise
+                progress("Half precision failed, retrying in full precision...")
+                return self._transcribe(audio, language, task, options, fp16=False)
+
+    def _transcribe(self, audio, language, task, options, fp16):
+        import torch
+
+        # No autograd bookkeeping is needed for inference, and on the GPU
+        # autocast keeps the ops whisper leaves in fp32 on fp16 tensor cores
+        with torch.inference_mode(), torch.autocast('cuda', dtype=torch.float16, enabled=fp16):
+            return self.model.transcribe(
+                audio,
+                verbose=False,
+                fp16=fp16,
+                language=language,
+                task=task,
+                **options
+            )
+
+
+class FasterWhisperBackend:
+    """CTranslate2 implementation from faster-whisper with int8 weights"""
+
+    name = FASTER_WHISPER
+
+    decode_options = {
+        FAST_MODE: dict(beam_size=1, best_of=1, temperature=0, condition_on_previous_text=False),
+        ACCURATE_MODE: dict(beam_size=5, best_of=5),
+    }
+
+    def __init__(self, model_size, device, progress=None, cpu_int8=True, compute_type=None):
+        # Model files are fetched by huggingface_hub, which already
+        # downloads in parallel
+        from faster_whisper import WhisperModel
+
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type or faster_whisper_compute_type(device, cpu_int8)
+        # On the GPU one worker per concurrent chunk; on the CPU parallel
+        # chunks would only split the same cores, so one worker uses them all
+        self.num_workers = CHUNK_WORKERS if device == 'cuda' else 1
+        self.model = WhisperModel(
+            get_bundled_faster_whisper_model(model_size) or model_size,
+            device=device,
+            compute_type=self.compute_type,
+            cpu_threads=max(1, (os.cpu_count() or 1) // self.num_workers),
+            num_workers=self.num_workers
+        )
+
+    def load_audio(self, audio_file):
+        """Decode the audio file for transcribe()"""
+        from faster_whisper import decode_audio as faster_decode_audio
+        return decode_audio(audio_file, faster_decode_audio)
+
+    def warm_up(self):
+        """Run a short silent transcription to initialize the runtime"""
+        segments, _ = self.model.transcribe(silent_audio(), beam_size=1)
+        list(segments)
+
+    def transcribe(self, audio, language, task, progress, is_cancelled,
+                   accuracy_mode=FAST_MODE, vad=True):
+        """Transcribe the waveform, in parallel chunks if it is long"""
+        options = dict(self.decode_options[accuracy_mode], vad_filter=vad)
+        if vad:
+            options['vad_parameters'] = dict(min_silence_duration_ms=VAD_MIN_SILENCE_MS)
+        if len(audio) <= LONG_AUDIO_SECONDS * WHISPER_SAMPLE_RATE:
+            return self._transcribe(audio, language, task, options, progress, is_cancelled)
+        return self._transcribe_chunks(audio, language, task, options, progress, is_cancelled)
+
+    def _transcribe_chunks(self, audio, language, task, options, progress, is_cancelled):
+        """Transcribe overlapping chunks, in parallel on each model worker"""
+        chunks = split_into_chunks(audio)
+        total = len(chunks)
+
+        def run_chunk(chunk, chunk_language):
+            return self._transcribe(chunk, chunk_language, task, options, None, is_cancelled)
+
+        # The first chunk detects the language so every chunk agrees on it
+        results = [run_chunk(chunks[0], language)]
+        language = results[0]['language']
+        progress(f"Transcribing chunk 1/{total}...", 100 // total)
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [executor.submit(run_chunk, chunk, language) for chunk in chunks[1:]]
+            for number, future in enumerate(futures, start=2):
+                if is_cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                results.append(future.result())
+                progress(f"Transcribing chunk {number}/{total}...", number * 100 // total)
+
+        return merge_chunk_results(results)
+
+    def _transcribe(self, audio, language, task, options, progress, is_cancelled):
+        """Transcribe a waveform, reporting progress as segments are decoded"""
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            task=task,
+            **options
+        )
+
+        collected = []
+        for segment in segments:
+            if is_cancelled():
+                break
+
+            collected.append({
+                'id': segment.id,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'avg_logprob': segment.avg_logprob,
+                'no_speech_prob': segment.no_speech_prob,
+            })
+
+            if progress is not None and info.duration:
+                percent = min(100, int(segment.end * 100 / info.duration))
+                progress(f"Transcribing... {percent}%", percent)
+
+        return {
+            'text': "".join(segment['text'] for segment in collected),
+            'language': info.language,
+            'segments': collected,
+        }
+
+
+def load_backend(backend_name, model_size, device, progress=None, cpu_int8=True,
+                 compute_type=None, is_cancelled=lambda: False):
+    """
+    Load a model of the given size with the named backend.
+    cpu_int8 selects int8 weights when running on the CPU; compute_type
+    overrides the faster-whisper compute type picked for the device.
+    is_cancelled() is polled while an openai-whisper checkpoint downloads.
+    """
+    if backend_name == OPENAI_WHISPER:
+        return OpenAIWhisperBackend(model_size, device, progress, cpu_int8, is_cancelled)
+    if backend_name == FASTER_WHISPER:
+        return FasterWhisperBackend(model_size, device, progress, cpu_int8, compute_type)
+    raise ValueError(f"Unknown backend: {backend_name}")
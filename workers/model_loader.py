@@ -1,33 +1,71 @@
 """
-Worker thread for loading Whisper models
+Background task for loading Whisper models
 """
 
-import whisper
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
+from workers.backends import DEFAULT_BACKEND, LoadCancelled, load_backend
 
-class ModelLoader(QThread):
-    """Worker thread for loading Whisper models"""
+
+class ModelLoaderSignals(QObject):
+    """Signals for ModelLoader (QRunnable cannot define its own)"""
 
     progress = pyqtSignal(str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()  # A newer model was requested while loading
+
+
+class ModelLoader(QRunnable):
+    """Thread pool task for loading Whisper models"""
 
-    def __init__(self, model_size, device):
+    def __init__(self, model_size, device, backend=DEFAULT_BACKEND, cpu_int8=True,
+                 compute_type=None):
         super().__init__()
+        # The window keeps a reference and reads attributes after run()
+        self.setAutoDelete(False)
+        self.signals = ModelLoaderSignals()
         self.model_size = model_size
         self.device = device
+        self.backend = backend
+        self.cpu_int8 = cpu_int8
+        self.compute_type = compute_type  # None picks one for the device
+        self.is_cancelled = False
+        self.active = True  # Cleared right before the final signal
 
     def run(self):
         """Load model in background"""
         try:
-            self.progress.emit(f"Loading {self.model_size} model...")
-            self.progress.emit("First time will download model, please wait...")
+            self.signals.progress.emit(f"Loading {self.model_size} model ({self.backend})...")
+            self.signals.progress.emit("First time will download model, please wait...")
 
-            model = whisper.load_model(self.model_size, device=self.device)
+            model = load_backend(
+                self.backend, self.model_size, self.device, self.signals.progress.emit,
+                self.cpu_int8, self.compute_type, lambda: self.is_cancelled
+            )
 
-            self.progress.emit("Model loaded successfully!")
-            self.finished.emit(model)
+            # Loading itself cannot be interrupted, but skip the warm-up and
+            # drop the model if it is no longer wanted
+            if self.is_cancelled:
+                del model
+                self.active = False
+                self.signals.cancelled.emit()
+                return
 
+            self.signals.progress.emit("Warming up kernels...")
+            model.warm_up()
+
+            self.signals.progress.emit("Model loaded successfully!")
+            self.active = False
+            self.signals.finished.emit(model)
+
+        except LoadCancelled:
+            self.active = False
+            self.signals.cancelled.emit()
         except Exception as e:
-            self.error.emit(f"Failed to load model: {str(e)}")
+            self.active = False
+            self.signals.error.emit(f"Failed to load model: {str(e)}")
+
+    def cancel(self):
+        """Stop a running download, or drop the model once loading returns"""
+        self.is_cancelled = True
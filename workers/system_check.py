@@ -0,0 +1,30 @@
+"""
+Background task for probing system capabilities
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.system_checker import SystemChecker
+
+
+class SystemCheckSignals(QObject):
+    """Signals for SystemCheckTask (QRunnable cannot define its own)"""
+
+    finished = pyqtSignal(dict)
+
+
+class SystemCheckTask(QRunnable):
+    """Runnable that runs a SystemChecker probe off the UI thread"""
+
+    def __init__(self, check=SystemChecker.check_system_gpu):
+        super().__init__()
+        self.check = check
+        self.signals = SystemCheckSignals()
+
+    def run(self):
+        try:
+            info = self.check()
+        except Exception as e:
+            print(f"Error checking system: {e}")
+            info = {}
+        self.signals.finished.emit(info)
@@ -1,48 +1,73 @@
 """
-Worker thread for audio transcription
+Background task for audio transcription
 """
 
 import os
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
+from workers.backends import TranscriptionCancelled
 
-class TranscriptionWorker(QThread):
-    """Worker thread for audio transcription"""
 
-    progress = pyqtSignal(str)  # Progress message
+class TranscriptionWorkerSignals(QObject):
+    """Signals for TranscriptionWorker (QRunnable cannot define its own)"""
+
+    progress = pyqtSignal(int, str)  # Progress percentage, message
     finished = pyqtSignal(dict)  # Results
     error = pyqtSignal(str)     # Error message
 
-    def __init__(self, model, audio_file, settings):
+
+class TranscriptionWorker(QRunnable):
+    """Thread pool task for audio transcription"""
+
+    def __init__(self, model, audio_file, settings, file_stat=None):
         super().__init__()
+        # The window keeps a reference and polls active after cancelling
+        self.setAutoDelete(False)
+        self.signals = TranscriptionWorkerSignals()
         self.model = model
         self.audio_file = audio_file
         self.settings = settings
+        self.file_stat = file_stat  # os.stat result taken when the file was selected
         self.is_cancelled = False
+        self._percent = 0  # Last reported progress percentage
+        self.active = True  # Cleared once run() has returned
 
     def run(self):
         """Run transcription in background"""
         try:
-            if not os.path.exists(self.audio_file):
-                self.error.emit("Audio file not found")
+            try:
+                file_stat = self.file_stat or os.stat(self.audio_file)
+            except FileNotFoundError:
+                self.signals.error.emit("Audio file not found")
                 return
 
             if self.model is None:
-                self.error.emit("Model not loaded")
+                self.signals.error.emit("Model not loaded")
                 return
 
-            self.progress.emit("Starting transcription...")
+            self.signals.progress.emit(0, "Starting transcription...")
 
             # Get file info
-            file_size = os.path.getsize(self.audio_file) / (1024 * 1024)
-            self.progress.emit(f"Processing file ({file_size:.1f} MB)...")
+            file_size = file_stat.st_size / (1024 * 1024)
+            self.signals.progress.emit(0, f"Processing file ({file_size:.1f} MB)...")
+
+            # Decode once; repeated runs on the same file reuse the waveform
+            self.signals.progress.emit(0, "Decoding audio...")
+            audio = self.model.load_audio(self.audio_file)
+
+            if self.is_cancelled:
+                return
 
             # Transcribe
+            self.signals.progress.emit(0, "Transcribing...")
             result = self.model.transcribe(
-                self.audio_file,
-                verbose=False,
+                audio,
                 language=None if self.settings['auto_detect'] else self.settings['language'],
-                task="transcribe" if not self.settings['translate'] else "translate"
+                task="transcribe" if not self.settings['translate'] else "translate",
+                progress=self.report_progress,
+                is_cancelled=lambda: self.is_cancelled,
+                accuracy_mode=self.settings['accuracy_mode'],
+                vad=self.settings['vad']
             )
 
             if self.is_cancelled:
@@ -57,12 +82,22 @@ class TranscriptionWorker(QThread):
                 "file_name": os.path.basename(self.audio_file)
             }
 
-            self.progress.emit("Transcription complete!")
-            self.finished.emit(output)
+            self.signals.progress.emit(100, "Transcription complete!")
+            self.signals.finished.emit(output)
 
+        except TranscriptionCancelled:
+            return
         except Exception as e:
-            self.error.emit(f"Transcription failed: {str(e)}")
+            self.signals.error.emit(f"Transcription failed: {str(e)}")
+        finally:
+            self.active = False
+
+    def report_progress(self, message, percent=None):
+        """Forward backend progress to the UI, keeping the last percent if none is given"""
+        if percent is not None:
+            self._percent = percent
+        self.signals.progress.emit(self._percent, message)
 
     def cancel(self):
-        """Cancel transcription"""
+        """Cancel transcription; the decode loop stops at its next check"""
         self.is_cancelled = True